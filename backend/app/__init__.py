@@ -3,26 +3,15 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 from flask_cors import CORS
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from app.config import Config
 
 db = SQLAlchemy()
 jwt = JWTManager()
 bcrypt = Bcrypt()
 
-def create_app():
+def create_app(config_class=Config):
     app = Flask(__name__)
-    
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
-    app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'mysql+pymysql://root:@localhost/wiki_kb')
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['JWT_ACCESS_TOKEN_EXPIRES'] = 86400
-    app.config['JWT_TOKEN_LOCATION'] = ['headers']
-    app.config['JWT_HEADER_NAME'] = 'Authorization'
-    app.config['JWT_HEADER_TYPE'] = 'Bearer'
+    app.config.from_object(config_class)
     
     db.init_app(app)
     jwt.init_app(app)
@@ -35,10 +24,11 @@ def create_app():
          allow_headers=['Content-Type', 'Authorization'],
          methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
     
-    with app.app_context():
-        from app.models import User, Document, Revision
-        db.create_all()
-        print(" Database tables created successfully!")
+    # Schema changes are applied with `flask schema upgrade`; boot only checks the version
+    if app.config['SCHEMA_CHECK_ON_STARTUP']:
+        from app.migrations import check_schema_version, running_schema_command
+        if not running_schema_command():
+            check_schema_version(app)
     
     from app.routes.auth import auth_bp
     from app.routes.documents import documents_bp
@@ -46,8 +36,11 @@ def create_app():
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(documents_bp, url_prefix='/api/documents')
     
+    from app.commands import schema_cli
+    app.cli.add_command(schema_cli)
+    
     @app.route('/api/health')
     def health():
         return {'status': 'OK', 'message': 'Wiki KB Python API (MySQL) is running'}
     
-    return app
\ No newline at end of file
+    return app
@@ -0,0 +1,34 @@
+"""ASGI deployment of the auth and documents APIs.
+
+Serves the same routes and JSON contract as the Flask app, but on Quart with an
+async SQLAlchemy engine, so waiting on MySQL or bcrypt does not pin a worker thread.
+Run with ``uvicorn asgi:app``.
+"""
+from quart import Quart
+from quart_cors import cors
+from app.config import Config
+from app.asgi.database import init_db
+
+def create_asgi_app(config_class=Config):
+    app = Quart(__name__)
+    app.config.from_object(config_class)
+    
+    init_db(app)
+    
+    app = cors(app,
+               allow_origin=['http://localhost:5173', 'http://127.0.0.1:5173'],
+               allow_credentials=True,
+               allow_headers=['Content-Type', 'Authorization'],
+               allow_methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
+    
+    from app.asgi.routes.auth import auth_bp
+    from app.asgi.routes.documents import documents_bp
+    
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(documents_bp, url_prefix='/api/documents')
+    
+    @app.route('/api/health')
+    async def health():
+        return {'status': 'OK', 'message': 'Wiki KB Python API (MySQL, ASGI) is running'}
+    
+    return app
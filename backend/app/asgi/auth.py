@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+import jwt
+from quart import current_app, jsonify, request
+from app.models.user import User
+from app.asgi.database import get_session
+
+# Tokens use the same claims as flask_jwt_extended so either deployment accepts the other's
+def create_access_token(identity):
+    now = datetime.now(timezone.utc)
+    claims = {
+        'fresh': False,
+        'iat': now,
+        'jti': str(uuid.uuid4()),
+        'type': 'access',
+        'sub': identity,
+        'nbf': now,
+        'exp': now + timedelta(seconds=current_app.config['JWT_ACCESS_TOKEN_EXPIRES'])
+    }
+    return jwt.encode(claims, current_app.config['JWT_SECRET_KEY'], algorithm='HS256')
+
+def get_jwt_identity():
+    header = request.headers.get('Authorization', '')
+    scheme, _, token = header.partition(' ')
+    if scheme != 'Bearer' or not token:
+        raise jwt.InvalidTokenError('Missing Bearer token')
+
+    claims = jwt.decode(token, current_app.config['JWT_SECRET_KEY'], algorithms=['HS256'])
+    if claims.get('type') != 'access':
+        raise jwt.InvalidTokenError('Only access tokens are allowed')
+    return claims['sub']
+
+def token_required(f):
+    @wraps(f)
+    async def decorated(*args, **kwargs):
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = await get_session().get(User, current_user_id)
+            
+            if not current_user:
+                return jsonify({'success': False, 'message': 'User not found'}), 401
+            
+            kwargs['current_user'] = current_user
+            return await f(*args, **kwargs)
+        
+        except Exception as e:
+            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
+    
+    return decorated
+
+def roles_required(*roles):
+    def decorator(f):
+        @wraps(f)
+        async def decorated(*args, **kwargs):
+            try:
+                current_user_id = get_jwt_identity()
+                current_user = await get_session().get(User, current_user_id)
+                
+                if not current_user:
+                    return jsonify({'success': False, 'message': 'User not found'}), 401
+                
+                if current_user.role not in roles:
+                    return jsonify({
+                        'success': False, 
+                        'message': f"Role '{current_user.role}' is not authorized"
+                    }), 403
+                
+                kwargs['current_user'] = current_user
+                return await f(*args, **kwargs)
+            
+            except Exception as e:
+                return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
+        
+        return decorated
+    return decorator
@@ -0,0 +1,39 @@
+from quart import current_app, g
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
+def async_database_url(url):
+    """Swap a blocking driver (pymysql, pysqlite) for its asyncio counterpart."""
+    url = make_url(url)
+    if url.get_dialect().is_async:
+        return url
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+def init_db(app):
+    engine = create_async_engine(
+        async_database_url(app.config['SQLALCHEMY_DATABASE_URI']),
+        echo=app.config.get('SQLALCHEMY_ECHO', False),
+        pool_pre_ping=True
+    )
+    # Keep loaded attributes after commit so handlers can serialise without another round trip
+    app.extensions['async_session'] = async_sessionmaker(engine, expire_on_commit=False)
+
+    @app.after_serving
+    async def dispose_engine():
+        await engine.dispose()
+
+    @app.teardown_appcontext
+    async def close_session(exc):
+        session = g.pop('db_session', None)
+        if session is not None:
+            await session.close()
+
+def get_session():
+    if 'db_session' not in g:
+        g.db_session = current_app.extensions['async_session']()
+    return g.db_session
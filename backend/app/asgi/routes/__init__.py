@@ -0,0 +1,4 @@
+from app.asgi.routes.auth import auth_bp
+from app.asgi.routes.documents import documents_bp
+
+__all__ = ['auth_bp', 'documents_bp']
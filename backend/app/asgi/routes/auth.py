@@ -0,0 +1,90 @@
+import asyncio
+from quart import Blueprint, request, jsonify
+from app import db
+from app.models.user import User
+from app.asgi.auth import create_access_token, token_required
+from app.asgi.database import get_session
+
+auth_bp = Blueprint('auth', __name__)
+
+async def find_by_email(session, email):
+    result = await session.scalars(db.select(User).filter_by(email=email.lower().strip()))
+    return result.first()
+
+@auth_bp.route('/register', methods=['POST'])
+async def register():
+    try:
+        data = await request.get_json()
+        
+        name = data.get('name', '').strip()
+        email = data.get('email', '').strip().lower()
+        password = data.get('password', '')
+        role = data.get('role', 'viewer')
+        
+        if not name or len(name) < 2:
+            return jsonify({'success': False, 'message': 'Name must be at least 2 characters'}), 400
+        
+        if not email or '@' not in email:
+            return jsonify({'success': False, 'message': 'Valid email is required'}), 400
+        
+        if not password or len(password) < 6:
+            return jsonify({'success': False, 'message': 'Password must be at least 6 characters'}), 400
+        
+        session = get_session()
+        if await find_by_email(session, email):
+            return jsonify({'success': False, 'message': 'User with this email already exists'}), 400
+        
+        # bcrypt is CPU bound; hash off the event loop
+        user = await asyncio.to_thread(User.build_user, name, email, password, role)
+        session.add(user)
+        await session.commit()
+        
+        token = create_access_token(identity=user.id)
+        
+        return jsonify({
+            'success': True,
+            'token': token,
+            'user': user.to_dict()
+        }), 201
+    
+    except Exception as e:
+        print(f"Register error: {e}")
+        return jsonify({'success': False, 'message': 'Server error during registration'}), 500
+
+@auth_bp.route('/login', methods=['POST'])
+async def login():
+    try:
+        data = await request.get_json()
+        
+        email = data.get('email', '').strip().lower()
+        password = data.get('password', '')
+        
+        if not email or not password:
+            return jsonify({'success': False, 'message': 'Email and password are required'}), 400
+        
+        user = await find_by_email(get_session(), email)
+        if not user:
+            return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
+        
+        if not await asyncio.to_thread(user.check_password, password):
+            return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
+        
+        token = create_access_token(identity=user.id)
+        
+        return jsonify({
+            'success': True,
+            'token': token,
+            'user': user.to_dict()
+        })
+    
+    except Exception as e:
+        print(f"Login error: {e}")
+        return jsonify({'success': False, 'message': 'Server error during login'}), 500
+
+@auth_bp.route('/me', methods=['GET'])
+@token_required
+async def get_me(current_user):
+    return jsonify({
+        'success': True,
+        'user': current_user.to_dict()
+    })
@@ -0,0 +1,171 @@
+from quart import Blueprint, request, jsonify
+from sqlalchemy.orm import selectinload
+from app.models.document import Document
+from app.models.revision import Revision
+from app.asgi.auth import token_required, roles_required
+from app.asgi.database import get_session
+
+documents_bp = Blueprint('documents', __name__)
+
+# Write paths reuse the synchronous model helpers through AsyncSession.run_sync, which
+# drives them on the event loop without blocking it. Serialisation happens in the same
+# call so lazy relationships can still load.
+
+@documents_bp.route('', methods=['GET'])
+@token_required
+async def get_documents(current_user):
+    try:
+        session = get_session()
+        documents = (await session.scalars(
+            Document.accessible_select(current_user.id, current_user.role)
+        )).all()
+        
+        counts = dict((await session.execute(
+            Revision.count_by_document_select([doc.id for doc in documents])
+        )).all()) if documents else {}
+        
+        docs_list = []
+        for doc in documents:
+            doc_dict = doc.to_dict(include_revisions=False)
+            doc_dict['revision_count'] = counts.get(doc.id, 0)
+            docs_list.append(doc_dict)
+        
+        return jsonify({
+            'success': True,
+            'count': len(docs_list),
+            'documents': docs_list
+        })
+    
+    except Exception as e:
+        print(f"Get documents error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@documents_bp.route('/<int:doc_id>', methods=['GET'])
+@token_required
+async def get_document(doc_id, current_user):
+    try:
+        doc = await get_session().get(Document, doc_id, options=[selectinload(Document.revisions)])
+        if not doc:
+            return jsonify({'success': False, 'message': 'Document not found'}), 404
+        
+        if not Document.can_view(doc, current_user.id, current_user.role):
+            return jsonify({'success': False, 'message': 'Not authorized to view'}), 403
+        
+        return jsonify({
+            'success': True,
+            'document': doc.to_dict()
+        })
+    
+    except Exception as e:
+        print(f"Get document error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@documents_bp.route('', methods=['POST'])
+@roles_required('admin', 'editor')
+async def create_document(current_user):
+    try:
+        data = await request.get_json() or {}
+        
+        title = data.get('title', 'New Document')
+        content = data.get('content', '# New Document\\n\\nStart writing here...')
+        is_public = data.get('is_public', True)
+        
+        document = await get_session().run_sync(lambda session: Document.create_document(
+            title, content, 
+            current_user.id, current_user.name, current_user.email, 
+            is_public, session=session
+        ).to_dict())
+        
+        return jsonify({
+            'success': True,
+            'document': document
+        }), 201
+    
+    except Exception as e:
+        print(f"Create document error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@documents_bp.route('/<int:doc_id>', methods=['PUT'])
+@token_required
+async def update_document(doc_id, current_user):
+    try:
+        session = get_session()
+        doc = await session.get(Document, doc_id)
+        if not doc:
+            return jsonify({'success': False, 'message': 'Document not found'}), 404
+        
+        if not Document.can_edit(doc, current_user.id, current_user.role):
+            return jsonify({'success': False, 'message': 'Not authorized to edit'}), 403
+        
+        data = await request.get_json() or {}
+        title = data.get('title', doc.title)
+        content = data.get('content', doc.content)
+        
+        document = await session.run_sync(lambda sync_session: Document.update_document(
+            doc, title, content, 
+            current_user.id, current_user.name, current_user.email,
+            session=sync_session
+        ).to_dict())
+        
+        return jsonify({
+            'success': True,
+            'document': document
+        })
+    
+    except Exception as e:
+        print(f"Update document error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@documents_bp.route('/<int:doc_id>', methods=['DELETE'])
+@token_required
+async def delete_document(doc_id, current_user):
+    try:
+        session = get_session()
+        doc = await session.get(Document, doc_id)
+        if not doc:
+            return jsonify({'success': False, 'message': 'Document not found'}), 404
+        
+        if not Document.can_delete(doc, current_user.id, current_user.role):
+            return jsonify({'success': False, 'message': 'Not authorized to delete'}), 403
+        
+        await session.run_sync(lambda sync_session: Document.delete_document(doc, session=sync_session))
+        
+        return jsonify({'success': True, 'message': 'Document deleted'})
+    
+    except Exception as e:
+        print(f"Delete document error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
+
+@documents_bp.route('/<int:doc_id>/restore/<int:revision_id>', methods=['POST'])
+@token_required
+async def restore_revision(doc_id, revision_id, current_user):
+    try:
+        session = get_session()
+        doc = await session.get(Document, doc_id)
+        if not doc:
+            return jsonify({'success': False, 'message': 'Document not found'}), 404
+        
+        if not Document.can_edit(doc, current_user.id, current_user.role):
+            return jsonify({'success': False, 'message': 'Not authorized to edit'}), 403
+        
+        def restore(sync_session):
+            updated_doc = Document.restore_revision(
+                doc, revision_id, 
+                current_user.id, current_user.name, current_user.email,
+                session=sync_session
+            )
+            return updated_doc.to_dict() if updated_doc else None
+        
+        document = await session.run_sync(restore)
+        
+        if not document:
+            return jsonify({'success': False, 'message': 'Revision not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'document': document
+        })
+    
+    except Exception as e:
+        print(f"Restore revision error: {e}")
+        return jsonify({'success': False, 'message': 'Server error'}), 500
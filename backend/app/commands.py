@@ -0,0 +1,46 @@
+import click
+from flask.cli import AppGroup
+from app import db
+
+schema_cli = AppGroup('schema', help='Manage database schema migrations.')
+
+@schema_cli.command('upgrade')
+@click.option('--target', type=int, default=None, help='Stop at this version instead of the latest.')
+def upgrade_command(target):
+    """Apply pending migrations."""
+    from app.migrations import upgrade
+    version = upgrade(db.engine, target=target, echo=click.echo)
+    click.echo(f"Schema is at version {version}")
+
+@schema_cli.command('current')
+def current_command():
+    """Show the applied schema version."""
+    from app.migrations import current_version
+    with db.engine.connect() as conn:
+        click.echo(current_version(conn))
+
+@schema_cli.command('explain')
+def explain_command():
+    """Print EXPLAIN plans for the hot queries; fail on a full scan, unindexed sort or missing index."""
+    from app.utils.query_plans import check_query_plans
+    with db.engine.connect() as conn:
+        try:
+            results = check_query_plans(conn)
+        except NotImplementedError as e:
+            raise click.ClickException(str(e))
+
+    regressions = 0
+    for result in results:
+        regressions += bool(result.regressions)
+        if result.regressions:
+            status = 'REGRESSED: ' + '; '.join(result.regressions)
+        elif result.issues:
+            status = 'ok (allowed: ' + '; '.join(result.issues) + ')'
+        else:
+            status = 'ok'
+        click.echo(f"{result.query.name}: {status}")
+        for line in result.plan:
+            click.echo(f"    {line}")
+
+    if regressions:
+        raise click.ClickException(f"{regressions} query plan(s) regressed")
@@ -7,9 +7,18 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key')
     JWT_ACCESS_TOKEN_EXPIRES = 86400
+    JWT_TOKEN_LOCATION = ['headers']
+    JWT_HEADER_NAME = 'Authorization'
+    JWT_HEADER_TYPE = 'Bearer'
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'mysql+pymysql://root:@localhost/wiki_kb')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    # Set to 'zlib' to compress revision bodies in content_blobs
+    REVISION_BLOB_COMPRESSION = os.getenv('REVISION_BLOB_COMPRESSION', '')
+    # Warn at boot when the database is behind the latest migration
+    SCHEMA_CHECK_ON_STARTUP = os.getenv('SCHEMA_CHECK_ON_STARTUP', '1') != '0'
+    # Seconds the boot check waits for a connection before giving up
+    SCHEMA_CHECK_CONNECT_TIMEOUT = int(os.getenv('SCHEMA_CHECK_CONNECT_TIMEOUT', '2'))
 
 class DevelopmentConfig(Config):
     DEBUG = True
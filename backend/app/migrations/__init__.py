@@ -0,0 +1,137 @@
+"""Versioned schema migrations.
+
+Each module in ``app/migrations/versions`` is named ``NNNN_description.py`` and
+defines ``upgrade(conn, echo)``, where ``echo`` reports progress. Applied versions are recorded in ``schema_version``.
+"""
+import importlib
+import pkgutil
+import sys
+from collections import namedtuple
+from datetime import datetime
+import click
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+from app import db
+
+VERSIONS_PACKAGE = 'app.migrations.versions'
+
+Migration = namedtuple('Migration', ['version', 'name', 'module'])
+
+version_metadata = sa.MetaData()
+
+# Options that take a value before the subcommand in ``flask [OPTIONS] COMMAND``
+FLASK_OPTIONS_WITH_VALUES = {'--app', '-A', '--env-file', '-e'}
+
+# DBAPI connect arguments that bound the connection attempt, per dialect. PyMySQL's
+# connect_timeout only covers the TCP connect, so the handshake needs read_timeout too
+CONNECT_TIMEOUT_ARGS = {
+    'mysql': ('connect_timeout', 'read_timeout'),
+    'sqlite': ('timeout',)
+}
+
+schema_version = sa.Table(
+    'schema_version', version_metadata,
+    sa.Column('version', sa.Integer, primary_key=True, autoincrement=False),
+    sa.Column('name', sa.String(100), nullable=False),
+    sa.Column('applied_at', sa.DateTime, nullable=False)
+)
+
+def _version_modules():
+    package = importlib.import_module(VERSIONS_PACKAGE)
+    for info in pkgutil.iter_modules(package.__path__):
+        prefix, _, name = info.name.partition('_')
+        if prefix.isdigit():
+            yield int(prefix), name, info.name
+
+def head_version():
+    """Latest migration version, read from file names without importing the migrations."""
+    return max((version for version, _, _ in _version_modules()), default=0)
+
+def load_migrations():
+    migrations = []
+    for version, name, module_name in _version_modules():
+        module = importlib.import_module(f'{VERSIONS_PACKAGE}.{module_name}')
+        migrations.append(Migration(version, name, module))
+    return sorted(migrations, key=lambda m: m.version)
+
+def current_version(conn):
+    if not sa.inspect(conn).has_table('schema_version'):
+        return 0
+    return conn.execute(sa.select(sa.func.max(schema_version.c.version))).scalar() or 0
+
+def _flask_subcommand(args):
+    args = iter(args)
+    for arg in args:
+        if arg in FLASK_OPTIONS_WITH_VALUES:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+def running_schema_command():
+    """True inside ``flask ... schema <command>``, which manages the version itself."""
+    ctx = click.get_current_context(silent=True)
+    # Flask loads the app before click resolves the subcommand, so argv is all there is to go on
+    return (ctx is not None and ctx.find_root().info_name == 'flask'
+            and _flask_subcommand(sys.argv[1:]) == 'schema')
+
+def _probe_engine(url, timeout):
+    connect_args = {arg: timeout for arg in CONNECT_TIMEOUT_ARGS.get(url.get_backend_name(), ())}
+    # NullPool, so no pre-fork connection is handed to every worker
+    return sa.create_engine(url, poolclass=NullPool, connect_args=connect_args)
+
+def check_schema_version(app):
+    """Log whether the database is behind the code. Never fails app startup."""
+    head = head_version()
+    with app.app_context():
+        # db.engine.url has Flask-SQLAlchemy's SQLite path handling applied
+        engine = _probe_engine(db.engine.url, app.config['SCHEMA_CHECK_CONNECT_TIMEOUT'])
+
+    try:
+        conn = engine.connect()
+    except SQLAlchemyError as e:
+        app.logger.warning(f"Database unreachable, skipping schema version check: {getattr(e, 'orig', None) or e}")
+        engine.dispose()
+        return None
+
+    try:
+        with conn:
+            # A database bootstrapped by the old create_all (or a new, empty one) has no schema_version
+            version = current_version(conn)
+    except SQLAlchemyError as e:
+        app.logger.warning(f"Could not read schema version, skipping check: {getattr(e, 'orig', None) or e}")
+        return None
+    finally:
+        engine.dispose()
+
+    if version < head:
+        app.logger.warning(
+            f"Database schema is at version {version}, code expects {head}. Run `flask schema upgrade`."
+        )
+    return version
+
+def upgrade(engine, target=None, echo=print):
+    """Apply pending migrations up to ``target`` (default: latest). Returns the new version."""
+    with engine.connect() as conn:
+        schema_version.create(conn, checkfirst=True)
+        conn.commit()
+
+        version = current_version(conn)
+        for migration in load_migrations():
+            if migration.version <= version:
+                continue
+            if target is not None and migration.version > target:
+                break
+
+            echo(f"Applying {migration.version:04d}_{migration.name}")
+            migration.module.upgrade(conn, echo)
+            conn.execute(schema_version.insert().values(
+                version=migration.version,
+                name=migration.name,
+                applied_at=datetime.utcnow()
+            ))
+            conn.commit()
+            version = migration.version
+
+    return version
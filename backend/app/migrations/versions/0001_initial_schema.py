@@ -0,0 +1,52 @@
+"""Baseline schema: users, documents and revisions as they were before migrations existed."""
+import sqlalchemy as sa
+
+metadata = sa.MetaData()
+
+users = sa.Table(
+    'users', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('name', sa.String(50), nullable=False),
+    sa.Column('email', sa.String(120), unique=True, nullable=False, index=True),
+    sa.Column('password', sa.String(255), nullable=False),
+    sa.Column('role', sa.Enum('admin', 'editor', 'viewer'), nullable=False),
+    sa.Column('created_at', sa.DateTime)
+)
+
+documents = sa.Table(
+    'documents', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('title', sa.String(200), nullable=False),
+    sa.Column('content', sa.Text, nullable=False),
+    sa.Column('owner_id', sa.Integer, sa.ForeignKey('users.id'), nullable=False, index=True),
+    sa.Column('owner_name', sa.String(50), nullable=False),
+    sa.Column('owner_email', sa.String(120), nullable=False),
+    sa.Column('editors', sa.Text),
+    sa.Column('viewers', sa.Text),
+    sa.Column('last_edited_by', sa.String(50)),
+    sa.Column('is_public', sa.Boolean),
+    sa.Column('created_at', sa.DateTime),
+    sa.Column('updated_at', sa.DateTime)
+)
+
+revisions = sa.Table(
+    'revisions', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('document_id', sa.Integer, sa.ForeignKey('documents.id', ondelete='CASCADE'), nullable=False),
+    sa.Column('content', sa.Text, nullable=False),
+    sa.Column('title', sa.String(200), nullable=False),
+    sa.Column('author_id', sa.Integer, sa.ForeignKey('users.id'), nullable=False),
+    sa.Column('author_name', sa.String(50), nullable=False),
+    sa.Column('author_email', sa.String(120), nullable=False),
+    sa.Column('changes', sa.String(255)),
+    sa.Column('added_lines', sa.Integer),
+    sa.Column('removed_lines', sa.Integer),
+    sa.Column('modified_lines', sa.Integer),
+    sa.Column('total_lines', sa.Integer),
+    sa.Column('restored_from_id', sa.Integer, sa.ForeignKey('revisions.id'), nullable=True),
+    sa.Column('created_at', sa.DateTime)
+)
+
+def upgrade(conn, echo):
+    # Databases that predate migrations were built by db.create_all() at app startup and already have these tables
+    metadata.create_all(conn, checkfirst=True)
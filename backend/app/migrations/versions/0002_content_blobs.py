@@ -0,0 +1,127 @@
+"""Move revision bodies into content-addressed, reference-counted content_blobs."""
+from datetime import datetime
+import sqlalchemy as sa
+from app.models.content_blob import content_hash, encode_content, blob_compression
+from app.utils.helpers import format_file_size
+
+BATCH_SIZE = 500
+
+metadata = sa.MetaData()
+
+content_blobs = sa.Table(
+    'content_blobs', metadata,
+    sa.Column('hash', sa.String(64), primary_key=True),
+    sa.Column('data', sa.LargeBinary(length=16777215), nullable=False),
+    sa.Column('compressed', sa.Boolean, nullable=False),
+    sa.Column('size', sa.Integer, nullable=False),
+    sa.Column('ref_count', sa.Integer, nullable=False),
+    sa.Column('created_at', sa.DateTime)
+)
+
+revisions = sa.Table(
+    'revisions', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('content', sa.Text, nullable=False),
+    sa.Column('content_hash', sa.String(64), nullable=True)
+)
+
+def _add_content_hash_column(conn):
+    columns = [c['name'] for c in sa.inspect(conn).get_columns('revisions')]
+    if 'content_hash' in columns:
+        return
+
+    conn.execute(sa.text('ALTER TABLE revisions ADD COLUMN content_hash VARCHAR(64) NULL'))
+    conn.execute(sa.text('CREATE INDEX ix_revisions_content_hash ON revisions (content_hash)'))
+    if conn.dialect.name != 'sqlite':
+        conn.execute(sa.text(
+            'ALTER TABLE revisions ADD CONSTRAINT fk_revisions_content_hash '
+            'FOREIGN KEY (content_hash) REFERENCES content_blobs (hash)'
+        ))
+
+def _dedupe_batch(conn, rows, compression):
+    """Point one batch of revisions at blobs. Returns (original_bytes, new_blob_bytes)."""
+    texts = {}
+    refs = {}
+    assignments = []
+    original_bytes = 0
+
+    for rev_id, text in rows:
+        digest = content_hash(text)
+        texts[digest] = text
+        refs[digest] = refs.get(digest, 0) + 1
+        assignments.append({'rev_id': rev_id, 'digest': digest})
+        original_bytes += len((text or '').encode('utf-8'))
+
+    existing = set(conn.execute(
+        sa.select(content_blobs.c.hash).where(content_blobs.c.hash.in_(list(refs)))
+    ).scalars())
+
+    new_blobs = []
+    new_bytes = 0
+    for digest, count in refs.items():
+        if digest in existing:
+            continue
+        data, compressed = encode_content(texts[digest], compression)
+        new_blobs.append({
+            'hash': digest,
+            'data': data,
+            'compressed': compressed,
+            'size': len((texts[digest] or '').encode('utf-8')),
+            'ref_count': count,
+            'created_at': datetime.utcnow()
+        })
+        new_bytes += len(data)
+
+    if new_blobs:
+        conn.execute(content_blobs.insert(), new_blobs)
+    if existing:
+        conn.execute(
+            content_blobs.update()
+            .where(content_blobs.c.hash == sa.bindparam('digest'))
+            .values(ref_count=content_blobs.c.ref_count + sa.bindparam('count')),
+            [{'digest': d, 'count': refs[d]} for d in existing]
+        )
+
+    conn.execute(
+        revisions.update()
+        .where(revisions.c.id == sa.bindparam('rev_id'))
+        .values(content_hash=sa.bindparam('digest'), content=''),
+        assignments
+    )
+
+    return original_bytes, new_bytes
+
+def upgrade(conn, echo):
+    metadata.tables['content_blobs'].create(conn, checkfirst=True)
+    _add_content_hash_column(conn)
+    conn.commit()
+
+    compression = blob_compression()
+    migrated = original_bytes = stored_bytes = 0
+    last_id = 0
+
+    while True:
+        rows = conn.execute(
+            sa.select(revisions.c.id, revisions.c.content)
+            .where(revisions.c.content_hash.is_(None), revisions.c.id > last_id)
+            .order_by(revisions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        batch_original, batch_stored = _dedupe_batch(conn, rows, compression)
+        conn.commit()
+
+        migrated += len(rows)
+        original_bytes += batch_original
+        stored_bytes += batch_stored
+        last_id = rows[-1][0]
+        echo(f"  deduplicated {migrated} revisions")
+
+    saved = original_bytes - stored_bytes
+    percent = (saved / original_bytes * 100) if original_bytes else 0
+    echo(
+        f"  {migrated} revisions: {format_file_size(original_bytes)} -> "
+        f"{format_file_size(stored_bytes)} (saved {format_file_size(saved)}, {percent:.1f}%)"
+    )
@@ -0,0 +1,31 @@
+"""Composite indexes for document listing, revision history and per-author lookups."""
+import sqlalchemy as sa
+
+metadata = sa.MetaData()
+
+documents = sa.Table(
+    'documents', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('is_public', sa.Boolean),
+    sa.Column('updated_at', sa.DateTime)
+)
+
+revisions = sa.Table(
+    'revisions', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('document_id', sa.Integer),
+    sa.Column('author_id', sa.Integer),
+    sa.Column('created_at', sa.DateTime)
+)
+
+INDEXES = [
+    sa.Index('ix_revisions_document_id_created_at', revisions.c.document_id, revisions.c.created_at),
+    sa.Index('ix_revisions_author_id', revisions.c.author_id),
+    sa.Index('ix_documents_updated_at_id', documents.c.updated_at, documents.c.id),
+    sa.Index('ix_documents_is_public_updated_at', documents.c.is_public, documents.c.updated_at)
+]
+
+def upgrade(conn, echo):
+    # Databases built by the startup db.create_all() after these indexes reached the models already have them
+    for index in INDEXES:
+        index.create(conn, checkfirst=True)
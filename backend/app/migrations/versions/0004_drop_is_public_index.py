@@ -0,0 +1,16 @@
+"""Drop ix_documents_is_public_updated_at: no query filters on is_public alone, so it only slowed writes."""
+import sqlalchemy as sa
+
+metadata = sa.MetaData()
+
+documents = sa.Table(
+    'documents', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('is_public', sa.Boolean),
+    sa.Column('updated_at', sa.DateTime)
+)
+
+index = sa.Index('ix_documents_is_public_updated_at', documents.c.is_public, documents.c.updated_at)
+
+def upgrade(conn, echo):
+    index.drop(conn, checkfirst=True)
@@ -1,5 +1,6 @@
 from app.models.user import User
+from app.models.content_blob import ContentBlob
 from app.models.document import Document
 from app.models.revision import Revision
 
-__all__ = ['User', 'Document', 'Revision']
\ No newline at end of file
+__all__ = ['User', 'ContentBlob', 'Document', 'Revision']
\ No newline at end of file
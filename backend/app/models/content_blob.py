@@ -0,0 +1,105 @@
+import hashlib
+import zlib
+from datetime import datetime
+from flask import current_app, has_app_context
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.config import Config
+
+def content_hash(text):
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+def encode_content(text, compression=None):
+    raw = (text or '').encode('utf-8')
+    if compression == 'zlib':
+        packed = zlib.compress(raw)
+        if len(packed) < len(raw):
+            return packed, True
+    return raw, False
+
+def blob_compression():
+    if has_app_context():
+        return current_app.config.get('REVISION_BLOB_COMPRESSION')
+    return Config.REVISION_BLOB_COMPRESSION
+
+def decode_content(data, compressed):
+    if compressed:
+        data = zlib.decompress(data)
+    return data.decode('utf-8')
+
+class ContentBlob(db.Model):
+    __tablename__ = 'content_blobs'
+
+    hash = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.LargeBinary(length=16777215), nullable=False)
+    compressed = db.Column(db.Boolean, nullable=False, default=False)
+    size = db.Column(db.Integer, nullable=False, default=0)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ContentBlob {self.hash[:12]} refs={self.ref_count}>'
+
+    @property
+    def text(self):
+        return decode_content(self.data, self.compressed)
+
+    @staticmethod
+    def store(text, session=None):
+        """Return the blob holding ``text``, creating it if needed, with one more reference."""
+        session = session or db.session
+        digest = content_hash(text)
+
+        for attempt in range(3):
+            # Increment first: a blob found by a plain lookup may be deleted by a
+            # concurrent release() before we get to bump its count
+            updated = session.execute(
+                db.update(ContentBlob)
+                .where(ContentBlob.hash == digest)
+                .values(ref_count=ContentBlob.ref_count + 1)
+            ).rowcount
+            if updated:
+                blob = session.get(ContentBlob, digest)
+                session.expire(blob, ['ref_count'])
+                return blob
+
+            stale = session.identity_map.get(session.identity_key(ContentBlob, digest))
+            if stale is not None:
+                session.expunge(stale)
+
+            data, compressed = encode_content(text, blob_compression())
+            try:
+                with session.begin_nested():
+                    blob = ContentBlob(
+                        hash=digest,
+                        data=data,
+                        compressed=compressed,
+                        size=len((text or '').encode('utf-8')),
+                        ref_count=1
+                    )
+                    session.add(blob)
+                return blob
+            except IntegrityError:
+                # Another request inserted the same content first; count a reference on theirs
+                if attempt == 2:
+                    raise
+
+    @staticmethod
+    def release(digests, session=None):
+        """Drop one reference per hash and delete blobs nobody points at anymore."""
+        session = session or db.session
+        for digest in digests:
+            if not digest:
+                continue
+            session.execute(
+                db.update(ContentBlob)
+                .where(ContentBlob.hash == digest)
+                .values(ref_count=ContentBlob.ref_count - 1)
+            )
+
+        hashes = set(d for d in digests if d)
+        if hashes:
+            session.execute(
+                db.delete(ContentBlob)
+                .where(ContentBlob.hash.in_(hashes), ContentBlob.ref_count <= 0)
+            )
@@ -1,9 +1,13 @@
 from datetime import datetime
 from app import db
 from app.models.revision import Revision
+from app.models.content_blob import ContentBlob
 
 class Document(db.Model):
     __tablename__ = 'documents'
+    __table_args__ = (
+        db.Index('ix_documents_updated_at_id', 'updated_at', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -90,7 +94,9 @@ class Document(db.Model):
         }
     
     @staticmethod
-    def create_document(title, content, owner_id, owner_name, owner_email, is_public=True):
+    def create_document(title, content, owner_id, owner_name, owner_email, is_public=True, session=None):
+        session = session or db.session
+        
         doc = Document(
             title=title,
             content=content,
@@ -105,7 +111,7 @@ class Document(db.Model):
         diff = Document.calculate_diff('', content)
         
         revision = Revision(
-            content=content,
+            blob=ContentBlob.store(content, session),
             title=title,
             author_id=owner_id,
             author_name=owner_name,
@@ -119,13 +125,15 @@ class Document(db.Model):
         
         doc.revisions.append(revision)
         
-        db.session.add(doc)
-        db.session.commit()
+        session.add(doc)
+        session.commit()
         
         return doc
     
     @staticmethod
-    def update_document(doc, title, content, user_id, user_name, user_email):
+    def update_document(doc, title, content, user_id, user_name, user_email, session=None):
+        session = session or db.session
+        
         diff = Document.calculate_diff(doc.content, content)
         
         changes = []
@@ -141,7 +149,7 @@ class Document(db.Model):
         change_summary = ', '.join(changes) if changes else 'Minor edits'
         
         revision = Revision(
-            content=content,
+            blob=ContentBlob.store(content, session),
             title=title,
             author_id=user_id,
             author_name=user_name,
@@ -159,20 +167,22 @@ class Document(db.Model):
         doc.updated_at = datetime.utcnow()
         doc.revisions.append(revision)
         
-        db.session.commit()
+        session.commit()
         
         return doc
     
     @staticmethod
-    def restore_revision(doc, revision_id, user_id, user_name, user_email):
-        revision = Revision.query.get(revision_id)
+    def restore_revision(doc, revision_id, user_id, user_name, user_email, session=None):
+        session = session or db.session
+        
+        revision = session.get(Revision, revision_id)
         if not revision or revision.document_id != doc.id:
             return None
         
         diff = Document.calculate_diff(doc.content, revision.content)
         
         new_revision = Revision(
-            content=revision.content,
+            blob=ContentBlob.store(revision.content, session),
             title=revision.title,
             author_id=user_id,
             author_name=user_name,
@@ -191,10 +201,20 @@ class Document(db.Model):
         doc.updated_at = datetime.utcnow()
         doc.revisions.append(new_revision)
         
-        db.session.commit()
+        session.commit()
         
         return doc
     
+    @staticmethod
+    def delete_document(doc, session=None):
+        session = session or db.session
+        digests = [rev.content_hash for rev in doc.revisions]
+        
+        session.delete(doc)
+        session.flush()
+        ContentBlob.release(digests, session)
+        session.commit()
+    
     @staticmethod
     def can_edit(doc, user_id, user_role):
         if user_role == 'admin':
@@ -228,15 +248,20 @@ class Document(db.Model):
         return False
     
     @staticmethod
-    def find_all_accessible(user_id, user_role):
-        if user_role == 'admin':
-            return Document.query.order_by(Document.updated_at.desc()).all()
-        else:
-            return Document.query.filter(
+    def accessible_select(user_id, user_role):
+        query = db.select(Document)
+        if user_role != 'admin':
+            query = query.where(
                 db.or_(
                     Document.owner_id == user_id,
                     Document.editors.like(f'%{user_id}%'),
                     Document.viewers.like(f'%{user_id}%'),
                     Document.is_public == True
                 )
-            ).order_by(Document.updated_at.desc()).all()
\ No newline at end of file
+            )
+        return query.order_by(Document.updated_at.desc())
+    
+    @staticmethod
+    def find_all_accessible(user_id, user_role, session=None):
+        session = session or db.session
+        return session.scalars(Document.accessible_select(user_id, user_role)).all()
\ No newline at end of file
@@ -3,10 +3,16 @@ from app import db
 
 class Revision(db.Model):
     __tablename__ = 'revisions'
+    __table_args__ = (
+        db.Index('ix_revisions_document_id_created_at', 'document_id', 'created_at'),
+        db.Index('ix_revisions_author_id', 'author_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     document_id = db.Column(db.Integer, db.ForeignKey('documents.id', ondelete='CASCADE'), nullable=False)
-    content = db.Column(db.Text, nullable=False)
+    # Bodies live in content_blobs; this column only holds rows not yet deduplicated
+    legacy_content = db.Column('content', db.Text, nullable=False, default='')
+    content_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'), nullable=True, index=True)
     title = db.Column(db.String(200), nullable=False)
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     author_name = db.Column(db.String(50), nullable=False)
@@ -21,12 +27,27 @@ class Revision(db.Model):
     restored_from_id = db.Column(db.Integer, db.ForeignKey('revisions.id'), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    blob = db.relationship('ContentBlob', lazy='joined')
     author = db.relationship('User', foreign_keys=[author_id])
     restored_from = db.relationship('Revision', remote_side=[id], backref='restored_versions')
     
     def __repr__(self):
         return f'<Revision {self.id} for Document {self.document_id}>'
     
+    @property
+    def content(self):
+        if self.blob is not None:
+            return self.blob.text
+        return self.legacy_content
+    
+    @staticmethod
+    def count_by_document_select(document_ids):
+        return (
+            db.select(Revision.document_id, db.func.count(Revision.id))
+            .where(Revision.document_id.in_(document_ids))
+            .group_by(Revision.document_id)
+        )
+    
     def to_dict(self):
         return {
             '_id': str(self.id),
@@ -32,13 +32,18 @@ class User(db.Model):
         }
     
     @staticmethod
-    def create_user(name, email, password, role='viewer'):
+    def build_user(name, email, password, role='viewer'):
         user = User(
             name=name.strip(),
             email=email.lower().strip(),
             role=role if role in ['admin', 'editor', 'viewer'] else 'viewer'
         )
         user.set_password(password)
+        return user
+    
+    @staticmethod
+    def create_user(name, email, password, role='viewer'):
+        user = User.build_user(name, email, password, role)
         db.session.add(user)
         db.session.commit()
         return user
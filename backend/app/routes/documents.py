@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
+from app import db
 from app.models.document import Document
+from app.models.revision import Revision
 from app.middleware.auth import token_required, roles_required
 
 documents_bp = Blueprint('documents', __name__)
@@ -10,10 +12,14 @@ def get_documents(current_user):
     try:
         documents = Document.find_all_accessible(current_user.id, current_user.role)
         
+        counts = dict(db.session.execute(
+            Revision.count_by_document_select([doc.id for doc in documents])
+        ).all()) if documents else {}
+        
         docs_list = []
         for doc in documents:
             doc_dict = doc.to_dict(include_revisions=False)
-            doc_dict['revision_count'] = len(doc.revisions)
+            doc_dict['revision_count'] = counts.get(doc.id, 0)
             docs_list.append(doc_dict)
         
         return jsonify({
@@ -111,9 +117,7 @@ def delete_document(doc_id, current_user):
         if not Document.can_delete(doc, current_user.id, current_user.role):
             return jsonify({'success': False, 'message': 'Not authorized to delete'}), 403
         
-        from app import db
-        db.session.delete(doc)
-        db.session.commit()
+        Document.delete_document(doc)
         
         return jsonify({'success': True, 'message': 'Document deleted'})
     
@@ -0,0 +1,126 @@
+import re
+from collections import namedtuple
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app import db
+from app.models.document import Document
+from app.models.revision import Revision
+
+# ``allow_full_scan`` names the dialects on which a full scan or unindexed sort is expected
+KeyQuery = namedtuple('KeyQuery', ['name', 'run', 'allow_full_scan', 'expected_index'],
+                      defaults=((), None))
+
+# ``issues`` is everything the plan does badly; ``regressions`` drops those the query is exempt from
+PlanResult = namedtuple('PlanResult', ['query', 'plan', 'issues', 'regressions'])
+
+# "SCAN documents", "SCAN TABLE documents AS d" (SQLite < 3.36) and whole-index walks such as
+# "SCAN revisions USING COVERING INDEX ix". "SCAN x USING INDEX ix" is an index-ordered walk
+# that replaces a sort, which is what the listing indexes are for
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(?: USING COVERING INDEX \w+)?$')
+SQLITE_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+ALL_DIALECTS = ('sqlite', 'mysql')
+
+def _revision_history(session, doc_id):
+    # Lazy-load Document.revisions for a known id, without needing the row to exist
+    doc = Document(id=doc_id)
+    make_transient_to_detached(doc)
+    session.add(doc)
+    return doc.revisions
+
+def key_queries(user_id=1, doc_id=1):
+    """The code paths behind the documents API; their SQL is captured as the ORM issues it."""
+    return [
+        # Unbounded, so MySQL reads every row anyway and usually prefers ALL + filesort to walking
+        # ix_documents_updated_at_id. A paginated listing (ORDER BY updated_at DESC, id DESC LIMIT n)
+        # would need the index on both
+        KeyQuery('list documents (admin)',
+                 lambda session: Document.find_all_accessible(user_id, 'admin', session),
+                 allow_full_scan=('mysql',), expected_index='ix_documents_updated_at_id'),
+        # The member filter matches editors/viewers with LIKE '%id%', which no index can serve
+        KeyQuery('list documents (member)',
+                 lambda session: Document.find_all_accessible(user_id, 'editor', session),
+                 allow_full_scan=ALL_DIALECTS),
+        KeyQuery('revision counts',
+                 lambda session: session.execute(Revision.count_by_document_select([doc_id, doc_id + 1])).all(),
+                 expected_index='ix_revisions_document_id_created_at'),
+        KeyQuery('get document', lambda session: session.get(Document, doc_id)),
+        KeyQuery('revision history', lambda session: _revision_history(session, doc_id),
+                 expected_index='ix_revisions_document_id_created_at')
+    ]
+
+@contextmanager
+def capture_statements(conn):
+    """Collect the (SQL, parameters) pairs executed on ``conn`` inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(conn, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(conn, 'before_cursor_execute', before_cursor_execute)
+
+def captured_statements(conn, run):
+    with Session(bind=conn) as session, capture_statements(conn) as statements:
+        run(session)
+    return statements
+
+def sqlite_plan_issues(details):
+    issues = []
+    for detail in details:
+        match = SQLITE_FULL_SCAN.match(detail)
+        if match:
+            issues.append(f'full scan of {match.group(1)}')
+        elif detail.startswith(SQLITE_SORT):
+            issues.append('sort without an index')
+    return issues
+
+def mysql_plan_issues(rows):
+    issues = []
+    for row in rows:
+        extra = row['Extra'] or ''
+        # type=index without "Using index" is an index-ordered walk, the MySQL twin of SQLite's USING INDEX
+        if row['type'] == 'ALL' or (row['type'] == 'index' and 'Using index' in extra):
+            issues.append(f"full scan of {row['table']}")
+        if 'Using filesort' in extra:
+            issues.append(f"sort without an index on {row['table']}")
+    return issues
+
+def explain(conn, statement, parameters=()):
+    """Return (plan lines, issues) for the SQL string ``statement`` on ``conn``."""
+    if conn.dialect.name == 'sqlite':
+        rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+        plan = [row[3] for row in rows]
+        return plan, sqlite_plan_issues(plan)
+    if conn.dialect.name == 'mysql':
+        rows = conn.exec_driver_sql(f'EXPLAIN {statement}', parameters).mappings().all()
+        plan = [f"{row['table']}: type={row['type']} key={row['key']} extra={row['Extra']}" for row in rows]
+        return plan, mysql_plan_issues(rows)
+
+    raise NotImplementedError(f'No EXPLAIN support for {conn.dialect.name}')
+
+def plan_regressions(query, issues, dialect_name):
+    if dialect_name not in query.allow_full_scan:
+        return issues
+    return [issue for issue in issues if not issue.startswith(('full scan', 'sort', 'does not use'))]
+
+def check_query_plans(conn, queries=None):
+    if conn.dialect.name not in ALL_DIALECTS:
+        raise NotImplementedError(f'No EXPLAIN support for {conn.dialect.name}')
+
+    results = []
+    for query in queries or key_queries():
+        plan, issues = [], []
+        for statement, parameters in captured_statements(conn, query.run):
+            statement_plan, statement_issues = explain(conn, statement, parameters)
+            plan += statement_plan
+            issues += statement_issues
+        if query.expected_index and not any(query.expected_index in line for line in plan):
+            issues.append(f'does not use {query.expected_index}')
+
+        results.append(PlanResult(query, plan, issues, plan_regressions(query, issues, conn.dialect.name)))
+    return results
@@ -0,0 +1,216 @@
+"""Compare concurrent-connection throughput and memory of the WSGI and ASGI deployments.
+
+Starts each server as a subprocess against the same DATABASE_URL, seeds an editor
+account and a few documents, then runs a weighted mix of document listing, login
+and registration (the last two are bcrypt bound) at increasing concurrency while
+sampling the server's resident memory. Both deployments issue the same SQL.
+
+    cd backend
+    flask --app run schema upgrade
+    pip install gunicorn
+    python bench/bench_concurrency.py --concurrency 10 50 200
+
+Memory is read from /proc, so RSS is reported only on Linux.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import shlex
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+DEPLOYMENTS = {
+    'wsgi': 'gunicorn --workers {workers} --threads 8 --bind 127.0.0.1:{port} run:app',
+    'asgi': 'uvicorn asgi:app --workers {workers} --host 127.0.0.1 --port {port}'
+}
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of ``pid`` and its children, or None off Linux."""
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            children = [int(c) for c in f.read().split()]
+        with open(f'/proc/{pid}/status') as f:
+            rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith('VmRSS:'))
+    except (OSError, StopIteration):
+        return None
+    return rss + sum(process_tree_rss(child) or 0 for child in children)
+
+def request(port, method, path, body=None, token=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    try:
+        conn.request(method, path, json.dumps(body) if body is not None else None, headers)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read() or b'null')
+    finally:
+        conn.close()
+
+def wait_until_healthy(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if request(port, 'GET', '/api/health')[0] == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'Server on port {port} did not become healthy')
+
+BENCH_PASSWORD = 'benchmark'
+
+def seed(port, documents):
+    email = f'bench-{uuid.uuid4().hex[:8]}@example.com'
+    status, data = request(port, 'POST', '/api/auth/register', {
+        'name': 'Bench', 'email': email, 'password': BENCH_PASSWORD, 'role': 'editor'
+    })
+    if status != 201:
+        raise RuntimeError(f'Could not register bench user: {data}')
+
+    token = data['token']
+    for i in range(documents):
+        request(port, 'POST', '/api/documents', {'title': f'Bench {i}', 'content': 'x\n' * 50}, token)
+    return email, token
+
+# Each operation returns (method, path, body, use_token, expected status)
+OPERATIONS = {
+    'list': lambda email: ('GET', '/api/documents', None, True, 200),
+    'login': lambda email: ('POST', '/api/auth/login', {'email': email, 'password': BENCH_PASSWORD}, False, 200),
+    'register': lambda email: ('POST', '/api/auth/register', {
+        'name': 'Bench', 'email': f'bench-{uuid.uuid4().hex}@example.com', 'password': BENCH_PASSWORD
+    }, False, 201)
+}
+
+def parse_mix(value):
+    """Parse ``list=8,login=1,register=1`` into operation weights."""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{name}', choose from {sorted(OPERATIONS)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+def percentile(values, fraction):
+    # Nearest-rank, so small samples never report p95 below the median
+    return values[max(math.ceil(len(values) * fraction) - 1, 0)] * 1000
+
+def run_load(port, email, token, concurrency, requests_per_client, mix):
+    latencies = {name: [] for name in mix}
+    errors = {name: 0 for name in mix}
+    failures = []
+    lock = threading.Lock()
+
+    def client(seed_value):
+        rng = random.Random(seed_value)
+        names = rng.choices(list(mix), weights=list(mix.values()), k=requests_per_client)
+        for name in names:
+            method, path, body, use_token, expected = OPERATIONS[name](email)
+            start = time.perf_counter()
+            try:
+                status, _ = request(port, method, path, body, token if use_token else None)
+            except Exception as e:
+                status = None
+                with lock:
+                    failures.append(f'{name}: {e!r}')
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies[name].append(elapsed)
+                if status != expected:
+                    errors[name] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(client, i) for i in range(concurrency)]
+    wall = time.perf_counter() - start
+    for future in futures:
+        # Surface bugs in the client itself rather than dropping them
+        future.result()
+
+    results = {}
+    for name in ['all'] + list(mix):
+        values = sorted(sum(latencies.values(), []) if name == 'all' else latencies[name])
+        if not values:
+            continue
+        results[name] = {
+            'count': len(values),
+            'rps': len(values) / wall,
+            'p50_ms': statistics.median(values) * 1000,
+            'p95_ms': percentile(values, 0.95),
+            'errors': sum(errors.values()) if name == 'all' else errors[name]
+        }
+    return results, failures
+
+def bench_deployment(name, args):
+    command = DEPLOYMENTS[name].format(workers=args.workers, port=args.port)
+    server = subprocess.Popen(shlex.split(command), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_healthy(args.port)
+        email, token = seed(args.port, args.documents)
+        idle_rss = process_tree_rss(server.pid)
+
+        results = []
+        for concurrency in args.concurrency:
+            peak_rss = [idle_rss or 0]
+            sampling = threading.Event()
+
+            def sample():
+                while not sampling.wait(0.1):
+                    peak_rss[0] = max(peak_rss[0], process_tree_rss(server.pid) or 0)
+
+            sampler = threading.Thread(target=sample)
+            sampler.start()
+            try:
+                stats, failures = run_load(args.port, email, token, concurrency, args.requests, args.mix)
+            finally:
+                sampling.set()
+                sampler.join()
+
+            results.append((concurrency, stats, failures, peak_rss[0] or None))
+        return idle_rss, results
+    finally:
+        server.terminate()
+        server.wait()
+
+def format_mb(value):
+    return f'{value / (1024 * 1024):.1f} MB' if value else 'n/a'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--deployments', nargs='+', choices=sorted(DEPLOYMENTS), default=['wsgi', 'asgi'])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[10, 50, 200])
+    parser.add_argument('--requests', type=int, default=20, help='Requests per client')
+    parser.add_argument('--mix', type=parse_mix, default='list=8,login=1,register=1',
+                        help='Weighted operations, e.g. list=8,login=1,register=1')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--documents', type=int, default=20)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+    print(f"{'deploy':<6} {'conc':>5} {'op':<9} {'count':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'errors':>6} {'peak RSS':>10}")
+    for name in args.deployments:
+        idle_rss, results = bench_deployment(name, args)
+        for concurrency, stats, failures, peak_rss in results:
+            for op, r in stats.items():
+                print(f"{name:<6} {concurrency:>5} {op:<9} {r['count']:>6} {r['rps']:>9.1f} {r['p50_ms']:>8.1f} "
+                      f"{r['p95_ms']:>8.1f} {r['errors']:>6} {format_mb(peak_rss) if op == 'all' else '':>10}")
+            for failure in failures[:3]:
+                print(f"{'':<6} {'':>5} failed {failure}")
+        print(f"{name:<6} idle RSS {format_mb(idle_rss)}")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Measure how long a fresh worker takes to import and build the app.
+
+Each run is a new interpreter, as a WSGI worker or a rolling restart would see it.
+Import time and create_app() time are reported separately so a slow new
+dependency can be told apart from slow work done at boot.
+
+    cd backend
+    python bench/bench_startup.py --runs 20 --budget-ms 800
+
+Exits non-zero when the median total exceeds --budget-ms. Pass --importtime to
+list the slowest modules using ``python -X importtime``.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROBE = '''
+import json, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+print(json.dumps({'import': imported - start, 'create_app': created - imported}))
+'''
+
+def run_once(target):
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=target, capture_output=True, text=True, check=True)
+    total = time.perf_counter() - start
+    timings = json.loads(out.stdout.strip().splitlines()[-1])
+    timings['process'] = total
+    return timings
+
+def slowest_imports(target, limit):
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'from app import create_app; create_app()'],
+                         cwd=target, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, module = line.split(':', 1)[1].split('|')
+        rows.append((int(cumulative_us), int(self_us), module.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+def summarize(values):
+    return {
+        'min': min(values) * 1000,
+        'median': statistics.median(values) * 1000,
+        'max': max(values) * 1000
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=None, help='Fail if the median total is slower')
+    parser.add_argument('--importtime', type=int, default=0, metavar='N', help='Show the N slowest imports')
+    args = parser.parse_args()
+
+    target = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    runs = [run_once(target) for _ in range(args.runs)]
+
+    print(f"{'phase':<12} {'min ms':>8} {'median ms':>10} {'max ms':>8}")
+    for phase in ('import', 'create_app', 'process'):
+        stats = summarize([r[phase] for r in runs])
+        print(f"{phase:<12} {stats['min']:>8.1f} {stats['median']:>10.1f} {stats['max']:>8.1f}")
+
+    if args.importtime:
+        print(f"\n{'cumulative ms':>13} {'self ms':>8}  module")
+        for cumulative, self_time, module in slowest_imports(target, args.importtime):
+            print(f"{cumulative / 1000:>13.1f} {self_time / 1000:>8.1f}  {module}")
+
+    median = statistics.median(r['import'] + r['create_app'] for r in runs) * 1000
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"\nMedian startup {median:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import pytest
+from app import create_app, db
+from app.config import Config
+from app.migrations import upgrade
+from app.models import User
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Build an app on a SQLite file in ``tmp_path``; the schema is left to the caller."""
+    def make(url=None, **settings):
+        class TestConfig(Config):
+            SQLALCHEMY_DATABASE_URI = url or f"sqlite:///{tmp_path / 'wiki.db'}"
+            SCHEMA_CHECK_ON_STARTUP = False
+            BCRYPT_LOG_ROUNDS = 4
+
+        for key, value in settings.items():
+            setattr(TestConfig, key, value)
+        return create_app(TestConfig)
+
+    return make
+
+@pytest.fixture
+def app(make_app):
+    app = make_app()
+    with app.app_context():
+        upgrade(db.engine, echo=lambda message: None)
+        yield app
+        db.engine.dispose()
+
+@pytest.fixture
+def editor(app):
+    return User.create_user('Editor', 'editor@example.com', 'secret1', 'editor')
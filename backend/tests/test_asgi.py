@@ -0,0 +1,159 @@
+import asyncio
+import pytest
+from flask_jwt_extended import create_access_token
+from app.asgi import create_asgi_app
+from app.asgi.database import async_database_url
+from app import db
+from app.config import Config
+from app.models import User
+
+@pytest.fixture
+def asgi_app(app):
+    # Same database as the migrated Flask app, through the aiosqlite driver
+    class AsyncTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite://', 'sqlite+aiosqlite://', 1)
+
+    return create_asgi_app(AsyncTestConfig)
+
+@pytest.fixture
+def viewer(app):
+    return User.create_user('Viewer', 'viewer@example.com', 'secret1', 'viewer')
+
+def call(asgi_app, requests):
+    """Run ``requests(client)`` against the ASGI app and return its result."""
+    async def run():
+        async with asgi_app.test_app() as test_app:
+            return await requests(test_app.test_client())
+    return asyncio.run(run())
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+async def json_of(response):
+    return response.status_code, await response.get_json()
+
+async def _get_me(client, token):
+    return await json_of(await client.get('/api/auth/me', headers=bearer(token)))
+
+def test_async_database_url_swaps_blocking_drivers():
+    assert async_database_url('mysql+pymysql://root:@localhost/wiki_kb').drivername == 'mysql+aiomysql'
+    assert async_database_url('sqlite:///wiki.db').drivername == 'sqlite+aiosqlite'
+    assert async_database_url('sqlite+aiosqlite:///wiki.db').drivername == 'sqlite+aiosqlite'
+
+def test_auth_flow(asgi_app):
+    async def requests(client):
+        register = await json_of(await client.post('/api/auth/register', json={
+            'name': 'Ann', 'email': 'Ann@Example.com', 'password': 'secret1', 'role': 'editor'
+        }))
+        duplicate = await json_of(await client.post('/api/auth/register', json={
+            'name': 'Ann', 'email': 'ann@example.com', 'password': 'secret1'
+        }))
+        wrong = await json_of(await client.post('/api/auth/login', json={'email': 'ann@example.com', 'password': 'nope'}))
+        login = await json_of(await client.post('/api/auth/login', json={'email': 'ann@example.com', 'password': 'secret1'}))
+        me = await json_of(await client.get('/api/auth/me', headers=bearer(login[1]['token'])))
+        return register, duplicate, wrong, login, me
+
+    register, duplicate, wrong, login, me = call(asgi_app, requests)
+
+    assert register[0] == 201 and register[1]['success'] and register[1]['token']
+    assert set(register[1]['user']) == {'id', 'name', 'email', 'role', 'createdAt'}
+    assert register[1]['user']['email'] == 'ann@example.com'
+    assert duplicate == (400, {'success': False, 'message': 'User with this email already exists'})
+    assert wrong == (401, {'success': False, 'message': 'Invalid credentials'})
+    assert login[0] == 200 and login[1]['user'] == register[1]['user']
+    assert me == (200, {'success': True, 'user': register[1]['user']})
+
+@pytest.mark.parametrize('headers', [{}, {'Authorization': 'Bearer not-a-token'}, {'Authorization': 'Token abc'}])
+def test_token_required_rejects_missing_or_bad_token(asgi_app, headers):
+    async def requests(client):
+        return [await json_of(await client.get(path, headers=headers))
+                for path in ('/api/auth/me', '/api/documents')]
+
+    for result in call(asgi_app, requests):
+        assert result == (401, {'success': False, 'message': 'Invalid or expired token'})
+
+def test_token_for_deleted_user_is_rejected(app, asgi_app):
+    user = User.create_user('Gone', 'gone@example.com', 'secret1', 'editor')
+    token = create_access_token(identity=user.id)
+    db.session.delete(user)
+    db.session.commit()
+
+    result = call(asgi_app, lambda client: _get_me(client, token))
+
+    assert result == (401, {'success': False, 'message': 'User not found'})
+
+def test_roles_required_rejects_viewer(app, asgi_app, viewer):
+    token = create_access_token(identity=viewer.id)
+
+    async def requests(client):
+        return await json_of(await client.post('/api/documents', json={'title': 'Nope'}, headers=bearer(token)))
+
+    assert call(asgi_app, requests) == (403, {'success': False, 'message': "Role 'viewer' is not authorized"})
+
+def test_documents_contract_matches_wsgi(app, asgi_app, editor):
+    token = create_access_token(identity=editor.id)
+
+    async def requests(client):
+        created = await json_of(await client.post('/api/documents', json={'title': 'Doc', 'content': 'alpha'},
+                                                  headers=bearer(token)))
+        doc_id = created[1]['document']['_id']
+        updated = await json_of(await client.put(f'/api/documents/{doc_id}', json={'content': 'beta'},
+                                                 headers=bearer(token)))
+        first_revision = updated[1]['document']['revisions'][0]['_id']
+        restored = await json_of(await client.post(f'/api/documents/{doc_id}/restore/{first_revision}',
+                                                   headers=bearer(token)))
+        missing_revision = await json_of(await client.post(f'/api/documents/{doc_id}/restore/9999',
+                                                           headers=bearer(token)))
+        missing_doc = await json_of(await client.get('/api/documents/9999', headers=bearer(token)))
+        listing = await json_of(await client.get('/api/documents', headers=bearer(token)))
+        fetched = await json_of(await client.get(f'/api/documents/{doc_id}', headers=bearer(token)))
+        return created, restored, missing_revision, missing_doc, listing, fetched
+
+    created, restored, missing_revision, missing_doc, listing, fetched = call(asgi_app, requests)
+    doc_id = created[1]['document']['_id']
+
+    assert created[0] == 201
+    assert [rev['content'] for rev in restored[1]['document']['revisions']] == ['alpha', 'beta', 'alpha']
+    assert missing_revision == (404, {'success': False, 'message': 'Revision not found'})
+    assert missing_doc == (404, {'success': False, 'message': 'Document not found'})
+    assert listing[0] == 200 and listing[1]['count'] == 1
+    assert listing[1]['documents'][0]['revision_count'] == 3
+
+    # Both deployments serve byte-identical JSON for the same rows
+    client = app.test_client()
+    assert client.get(f'/api/documents/{doc_id}', headers=bearer(token)).get_json() == fetched[1]
+    assert client.get('/api/documents', headers=bearer(token)).get_json() == listing[1]
+
+def test_delete_document(app, asgi_app, editor, viewer):
+    token = create_access_token(identity=editor.id)
+    viewer_token = create_access_token(identity=viewer.id)
+
+    async def requests(client):
+        created = await json_of(await client.post('/api/documents', json={'title': 'Doc'}, headers=bearer(token)))
+        doc_id = created[1]['document']['_id']
+        forbidden = await json_of(await client.delete(f'/api/documents/{doc_id}', headers=bearer(viewer_token)))
+        deleted = await json_of(await client.delete(f'/api/documents/{doc_id}', headers=bearer(token)))
+        gone = await json_of(await client.get(f'/api/documents/{doc_id}', headers=bearer(token)))
+        return forbidden, deleted, gone
+
+    forbidden, deleted, gone = call(asgi_app, requests)
+
+    assert forbidden == (403, {'success': False, 'message': 'Not authorized to delete'})
+    assert deleted == (200, {'success': True, 'message': 'Document deleted'})
+    assert gone[0] == 404
+
+def test_tokens_work_across_deployments(app, asgi_app, editor):
+    wsgi_token = create_access_token(identity=editor.id)
+
+    async def requests(client):
+        me = await _get_me(client, wsgi_token)
+        login = await json_of(await client.post('/api/auth/login',
+                                                json={'email': 'editor@example.com', 'password': 'secret1'}))
+        return me, login[1]['token']
+
+    me, asgi_token = call(asgi_app, requests)
+
+    assert me[0] == 200 and me[1]['user']['id'] == editor.id
+    response = app.test_client().get('/api/auth/me', headers=bearer(asgi_token))
+    assert response.status_code == 200
+    assert response.get_json()['user']['id'] == editor.id
@@ -0,0 +1,119 @@
+import importlib
+from flask import current_app
+from app import db
+from app.migrations import upgrade
+from app.models import ContentBlob, Document, Revision
+
+content_blobs_migration = importlib.import_module('app.migrations.versions.0002_content_blobs')
+baseline = importlib.import_module('app.migrations.versions.0001_initial_schema')
+
+def create(editor, title='Doc', content='alpha'):
+    return Document.create_document(title, content, editor.id, editor.name, editor.email)
+
+def update(doc, editor, title=None, content=None):
+    return Document.update_document(doc, title or doc.title, content if content is not None else doc.content,
+                                    editor.id, editor.name, editor.email)
+
+def ref_counts():
+    db.session.expire_all()
+    return {blob.text: blob.ref_count for blob in ContentBlob.query.all()}
+
+def test_title_only_save_reuses_blob(editor):
+    doc = update(create(editor), editor, title='Renamed')
+
+    assert doc.revisions[0].content_hash == doc.revisions[1].content_hash
+    assert ref_counts() == {'alpha': 2}
+
+def test_restore_reuses_blob(editor):
+    doc = update(create(editor), editor, content='beta')
+    doc = Document.restore_revision(doc, doc.revisions[0].id, editor.id, editor.name, editor.email)
+
+    assert [rev.content for rev in doc.revisions] == ['alpha', 'beta', 'alpha']
+    assert doc.revisions[2].content_hash == doc.revisions[0].content_hash
+    assert ref_counts() == {'alpha': 2, 'beta': 1}
+
+def test_back_and_forth_revert_stores_each_body_once(editor):
+    doc = create(editor)
+    for content in ['beta', 'alpha', 'beta']:
+        doc = update(doc, editor, content=content)
+
+    assert ref_counts() == {'alpha': 2, 'beta': 2}
+
+def test_compressed_blob_round_trips(editor):
+    current_app.config['REVISION_BLOB_COMPRESSION'] = 'zlib'
+    body = 'line of text\n' * 200
+
+    doc = create(editor, content=body)
+
+    blob = doc.revisions[0].blob
+    assert blob.compressed and len(blob.data) < blob.size
+    assert doc.revisions[0].content == body
+
+def test_delete_releases_blobs(editor):
+    first = update(create(editor, content='shared'), editor, content='only first')
+    second = create(editor, content='shared')
+
+    Document.delete_document(first)
+    assert ref_counts() == {'shared': 1}
+
+    Document.delete_document(second)
+    assert ref_counts() == {}
+
+def legacy_app(make_app):
+    """An app whose database stops at the baseline schema, holding revisions with inline content."""
+    app = make_app()
+    with app.app_context():
+        upgrade(db.engine, target=1, echo=lambda message: None)
+        with db.engine.begin() as conn:
+            conn.execute(baseline.users.insert().values(
+                id=1, name='Legacy', email='legacy@example.com', password='x', role='editor'
+            ))
+            conn.execute(baseline.documents.insert().values(
+                id=1, title='Legacy', content='', owner_id=1, owner_name='Legacy', owner_email='legacy@example.com'
+            ))
+    return app
+
+def insert_legacy_revisions(conn, bodies):
+    conn.execute(baseline.revisions.insert(), [
+        {'document_id': 1, 'content': body, 'title': 'Legacy', 'author_id': 1,
+         'author_name': 'Legacy', 'author_email': 'legacy@example.com'}
+        for body in bodies
+    ])
+
+def test_migration_dedupes_across_batches(make_app, monkeypatch):
+    monkeypatch.setattr(content_blobs_migration, 'BATCH_SIZE', 3)
+    # Duplicates straddle the 3-row batch boundaries
+    bodies = ['a', 'b', 'a', 'a', 'c', 'b', 'c', 'a']
+    app = legacy_app(make_app)
+    messages = []
+
+    with app.app_context():
+        with db.engine.begin() as conn:
+            insert_legacy_revisions(conn, bodies)
+        upgrade(db.engine, echo=messages.append)
+
+        assert ref_counts() == {'a': 4, 'b': 2, 'c': 2}
+        revisions = Revision.query.order_by(Revision.id).all()
+        assert [rev.legacy_content for rev in revisions] == [''] * len(bodies)
+        assert [rev.content for rev in revisions] == bodies
+        assert any('deduplicated 8 revisions' in m for m in messages)
+        assert any(m.strip().startswith('8 revisions:') for m in messages)
+
+def test_migration_resumes_onto_existing_blobs(make_app, monkeypatch):
+    monkeypatch.setattr(content_blobs_migration, 'BATCH_SIZE', 2)
+    app = legacy_app(make_app)
+
+    with app.app_context():
+        with db.engine.begin() as conn:
+            insert_legacy_revisions(conn, ['a', 'b', 'a'])
+        upgrade(db.engine, echo=lambda message: None)
+
+        # Rows left behind by an interrupted run: no content_hash yet, bodies still inline
+        with db.engine.connect() as conn:
+            insert_legacy_revisions(conn, ['a', 'c', 'b'])
+            conn.commit()
+            content_blobs_migration.upgrade(conn, lambda message: None)
+
+        assert ref_counts() == {'a': 3, 'b': 2, 'c': 1}
+        assert Revision.query.filter(Revision.content_hash.is_(None)).count() == 0
+        assert [rev.content for rev in Revision.query.order_by(Revision.id)] == ['a', 'b', 'a', 'a', 'c', 'b']
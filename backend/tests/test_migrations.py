@@ -0,0 +1,117 @@
+import importlib
+import logging
+import click
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.exc import TimeoutError
+from app import db
+from app.migrations import check_schema_version, current_version, head_version, running_schema_command, upgrade
+
+def test_upgrade_reaches_head_and_is_idempotent(make_app):
+    app = make_app()
+    with app.app_context():
+        assert upgrade(db.engine, echo=lambda message: None) == head_version()
+        assert upgrade(db.engine, echo=lambda message: None) == head_version()
+        with db.engine.connect() as conn:
+            assert current_version(conn) == head_version()
+
+def test_check_reports_empty_database_as_behind(make_app, caplog):
+    app = make_app()
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(app) == 0
+
+    assert f'code expects {head_version()}. Run `flask schema upgrade`' in caplog.text
+
+def test_check_reports_create_all_database_as_behind(make_app, caplog):
+    app = make_app()
+    baseline = importlib.import_module('app.migrations.versions.0001_initial_schema')
+    with app.app_context(), db.engine.begin() as conn:
+        baseline.metadata.create_all(conn)
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(app) == 0
+
+    assert 'Run `flask schema upgrade`' in caplog.text
+
+def test_check_is_quiet_when_up_to_date(make_app, caplog):
+    app = make_app()
+    with app.app_context():
+        upgrade(db.engine, echo=lambda message: None)
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(app) == head_version()
+
+    assert caplog.text == ''
+
+def test_check_survives_unreachable_database(make_app, tmp_path, caplog):
+    app = make_app(f"sqlite:///{tmp_path / 'missing' / 'wiki.db'}")
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(app) is None
+
+    assert 'Database unreachable' in caplog.text
+
+def test_check_survives_errors_without_orig(make_app, monkeypatch, caplog):
+    class TimingOutEngine:
+        def connect(self):
+            raise TimeoutError('QueuePool limit reached')
+
+        def dispose(self):
+            pass
+
+    monkeypatch.setattr('app.migrations._probe_engine', lambda url, timeout: TimingOutEngine())
+    app = make_app()
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(app) is None
+
+    assert 'Database unreachable, skipping schema version check: QueuePool limit reached' in caplog.text
+
+@pytest.mark.parametrize('url, connect_args', [
+    ('mysql+pymysql://root:@db.internal/wiki_kb', {'connect_timeout': 2, 'read_timeout': 2}),
+    (None, {'timeout': 2}),
+])
+def test_check_bounds_the_connect_attempt(make_app, monkeypatch, url, connect_args):
+    calls = []
+    def create_engine(url, **kwargs):
+        calls.append(kwargs)
+        raise sa.exc.ArgumentError('stop here')
+    app = make_app(url, SCHEMA_CHECK_CONNECT_TIMEOUT=2)
+    monkeypatch.setattr('app.migrations.sa.create_engine', create_engine)
+
+    with pytest.raises(sa.exc.ArgumentError):
+        check_schema_version(app)
+
+    assert calls[0]['connect_args'] == connect_args
+    assert calls[0]['poolclass'] is sa.pool.NullPool
+
+@pytest.mark.parametrize('argv, expected', [
+    (['flask', 'schema', 'upgrade'], True),
+    (['flask', '--app', 'run', 'schema', 'current'], True),
+    (['flask', '-A', 'run', '--debug', 'schema', 'explain'], True),
+    (['flask', '--app=run', '-e', '.env.test', 'schema', 'upgrade'], True),
+    (['flask', '--app', 'schema', 'run'], False),
+    (['flask', 'run', '--host', 'schema'], False),
+    (['flask', 'shell'], False),
+])
+def test_running_schema_command_matches_the_subcommand(monkeypatch, argv, expected):
+    monkeypatch.setattr('sys.argv', argv)
+
+    with click.Context(click.Group('flask'), info_name='flask'):
+        assert running_schema_command() is expected
+
+def test_running_schema_command_needs_the_flask_cli(monkeypatch):
+    monkeypatch.setattr('sys.argv', ['gunicorn', 'schema'])
+
+    assert running_schema_command() is False
+
+def test_upgrade_drops_unused_is_public_index(make_app):
+    app = make_app()
+    with app.app_context():
+        upgrade(db.engine, target=3, echo=lambda message: None)
+        upgrade(db.engine, echo=lambda message: None)
+        indexes = {index['name'] for index in sa.inspect(db.engine).get_indexes('documents')}
+
+    assert 'ix_documents_is_public_updated_at' not in indexes
+    assert 'ix_documents_updated_at_id' in indexes
@@ -0,0 +1,91 @@
+import pytest
+from app import db
+from app.utils.query_plans import (
+    check_query_plans, key_queries, mysql_plan_issues, plan_regressions, sqlite_plan_issues
+)
+
+def plans_by_name():
+    # A fresh connection, so SQLite plans against the current schema
+    db.engine.dispose()
+    with db.engine.connect() as conn:
+        return {result.query.name: result for result in check_query_plans(conn)}
+
+def test_key_queries_use_indexes(app):
+    results = plans_by_name()
+
+    regressed = {name: (r.regressions, r.plan) for name, r in results.items() if r.regressions}
+    assert not regressed
+
+def test_plans_cover_the_sql_the_orm_issues(app):
+    plans = plans_by_name()
+
+    # Revision.blob is joined eagerly, so history also reads content_blobs
+    assert any('content_blobs' in line for line in plans['revision history'].plan)
+
+def test_unbounded_admin_listing_may_scan_on_mysql_only():
+    admin, member = key_queries()[:2]
+    issues = ['full scan of documents', 'sort without an index on documents', 'does not use ix_documents_updated_at_id']
+
+    assert plan_regressions(admin, issues, 'mysql') == []
+    assert plan_regressions(admin, issues, 'sqlite') == issues
+    assert plan_regressions(member, issues[:2], 'sqlite') == []
+
+@pytest.mark.parametrize('index, query', [
+    ('ix_documents_updated_at_id', 'list documents (admin)'),
+    ('ix_revisions_document_id_created_at', 'revision history'),
+    ('ix_revisions_document_id_created_at', 'revision counts'),
+])
+def test_dropping_an_index_is_a_regression(app, index, query):
+    with db.engine.begin() as conn:
+        conn.execute(db.text(f'DROP INDEX {index}'))
+
+    assert plans_by_name()[query].regressions
+
+@pytest.mark.parametrize('detail, table', [
+    ('SCAN documents', 'documents'),
+    ('SCAN TABLE documents', 'documents'),
+    ('SCAN TABLE documents AS d', 'documents'),
+    ('SCAN revisions USING COVERING INDEX ix_revisions_author_id', 'revisions'),
+])
+def test_sqlite_full_scans(detail, table):
+    assert sqlite_plan_issues([detail]) == [f'full scan of {table}']
+
+def test_sqlite_sort_and_index_walks():
+    assert sqlite_plan_issues(['SCAN documents', 'USE TEMP B-TREE FOR ORDER BY']) == [
+        'full scan of documents', 'sort without an index'
+    ]
+    assert sqlite_plan_issues([
+        'SCAN documents USING INDEX ix_documents_updated_at_id',
+        'SEARCH revisions USING INDEX ix_revisions_author_id (author_id=?)',
+    ]) == []
+
+def test_mysql_full_scans_and_filesort():
+    rows = [
+        {'table': 'documents', 'type': 'ALL', 'Extra': 'Using where; Using filesort'},
+        {'table': 'revisions', 'type': 'index', 'Extra': 'Using index'},
+        {'table': 'content_blobs', 'type': 'eq_ref', 'Extra': None},
+    ]
+
+    assert mysql_plan_issues(rows) == [
+        'full scan of documents', 'sort without an index on documents', 'full scan of revisions'
+    ]
+
+def test_explain_command_reports_unsupported_dialect(app, monkeypatch):
+    def explain(conn, statement, parameters=()):
+        raise NotImplementedError('No EXPLAIN support for postgresql')
+    monkeypatch.setattr('app.utils.query_plans.explain', explain)
+
+    result = app.test_cli_runner().invoke(args=['schema', 'explain'])
+
+    assert result.exit_code == 1
+    assert 'No EXPLAIN support for postgresql' in result.output
+
+def test_explain_command_fails_on_regression(app):
+    with db.engine.begin() as conn:
+        conn.execute(db.text('DROP INDEX ix_revisions_document_id_created_at'))
+    db.engine.dispose()
+
+    result = app.test_cli_runner().invoke(args=['schema', 'explain'])
+
+    assert result.exit_code == 1
+    assert 'revision history: REGRESSED' in result.output